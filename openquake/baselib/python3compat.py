@@ -21,8 +21,8 @@ Compatibility layer for Python 2 and 3. Mostly copied from six and future,
 but reduced to the subset of utilities needed by GEM. This is done to
 avoid an external dependency.
 """
-import math
 import builtins
+from math import floor, copysign
 import numpy
 
 
@@ -66,9 +66,13 @@ def zip(arg, *args):
     return builtins.zip(arg, *args)
 
 
+# powers of ten used by round, to avoid computing them at each call
+_POW10 = {d: 10 ** d for d in range(16)}
+
+
 def round(x, d=0):
-    p = 10 ** d
-    return float(math.floor((x * p) + math.copysign(0.5, x))) / p
+    p = _POW10.get(d) or 10 ** d
+    return float(floor((x * p) + copysign(0.5, x))) / p
 
 
 def raise_(tp, value=None, tb=None):
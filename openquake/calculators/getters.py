@@ -400,7 +400,9 @@ class GmfGetter(object):
         :returns: a dict with keys gmfdata, indices, hcurves
         """
         oq = self.oqparam
-        mon = monitor('getting ruptures', measuremem=True)
+        # the memory is not measured, since the monitor is entered for
+        # each rupture and measuring the memory is a psutil call
+        mon = monitor('getting ruptures', measuremem=False)
         hcurves = {}  # key -> poes
         if oq.hazard_curves_from_gmfs:
             hc_mon = monitor('building hazard curves', measuremem=False)
@@ -444,10 +446,10 @@ def group_by_rlz(data, rlzs):
     :param rlzs: an array of E >= D elements
     :returns: a dictionary rlzi -> data for each realization
     """
-    acc = general.AccumDict(accum=[])
-    for rec in data:
-        acc[rlzs[rec['eid']]].append(rec)
-    return {rlzi: numpy.array(recs) for rlzi, recs in acc.items()}
+    rlzis = rlzs[data['eid']]
+    order = rlzis.argsort(kind='stable')  # keep the order of the records
+    uniq, starts = numpy.unique(rlzis[order], return_index=True)
+    return dict(zip(uniq, numpy.split(data[order], starts[1:])))
 
 
 def gen_rgetters(dstore, slc=slice(None)):
@@ -549,14 +551,23 @@ class RuptureGetter(object):
         """
         :returns: a composite array with the associations eid->rlz
         """
-        eid_rlz = []
+        all_eids, rupids, rlzs, nevents = [], [], [], []
         for rup in self.proxies:
             ebr = EBRupture(mock.Mock(rup_id=rup['serial']), rup['srcidx'],
                             self.grp_id, rup['n_occ'], self.samples)
             for rlz_id, eids in ebr.get_eids_by_rlz(self.rlzs_by_gsim).items():
-                for eid in eids:
-                    eid_rlz.append((eid + rup['e0'], rup['id'], rlz_id))
-        return numpy.array(eid_rlz, events_dt)
+                all_eids.append(eids + rup['e0'])
+                rupids.append(rup['id'])
+                rlzs.append(rlz_id)
+                nevents.append(len(eids))
+        # fill the fields of a preallocated array, without building
+        # a tuple for each event
+        eid_rlz = numpy.zeros(sum(nevents), events_dt)
+        if all_eids:
+            eid_rlz['id'] = numpy.concatenate(all_eids)
+            eid_rlz['rup_id'] = numpy.repeat(rupids, nevents)
+            eid_rlz['rlz_id'] = numpy.repeat(rlzs, nevents)
+        return eid_rlz
 
     def get_rupdict(self):
         """
@@ -79,7 +79,7 @@ class ScenarioCalculator(base.HazardCalculator):
             ebr, self.sitecol, oq.imtls, self.cmaker, oq.truncation_level,
             oq.correl_model, self.amplifier)
         M32 = (numpy.float32, len(self.oqparam.imtls))
-        self.sig_eps_dt = [('eid', numpy.uint64), ('sig', M32), ('eps', M32)]
+        self.sig_eps_dt = [('eid', numpy.uint32), ('sig', M32), ('eps', M32)]
 
     def init(self):
         pass
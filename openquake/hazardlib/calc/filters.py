@@ -178,7 +178,7 @@ def split_sources(srcs):
         has_serial = hasattr(src, 'serial')
         if has_serial:
             src.serial = numpy.arange(
-                src.serial, src.serial + src.num_ruptures)
+                src.serial, src.serial + src.num_ruptures, dtype=U32)
         if not splittable(src):
             sources.append(src)
             split_time[src.id] = time.time() - t0
@@ -22,13 +22,15 @@
 """
 import sys
 import time
+import itertools
 import numpy
 from openquake.baselib import hdf5
 from openquake.baselib.general import AccumDict
 from openquake.baselib.performance import Monitor
 from openquake.baselib.python3compat import raise_
 from openquake.hazardlib.calc.filters import nofilter
-from openquake.hazardlib.source.rupture import BaseRupture, EBRupture
+from openquake.hazardlib.source.rupture import (
+    BaseRupture, EBRupture, ParametricProbabilisticRupture)
 from openquake.hazardlib.geo.mesh import surface_to_array, point3d
 
 TWO16 = 2 ** 16  # 65,536
@@ -72,15 +74,29 @@ def stochastic_event_set(sources, source_site_filter=nofilter, **kwargs):
     shift_hypo = kwargs['shift_hypo'] if 'shift_hypo' in kwargs else False
     for source, s_sites in source_site_filter(sources):
         try:
-            for rupture in source.iter_ruptures(shift_hypo=shift_hypo):
-                [n_occ] = rupture.sample_number_of_occurrences()
-                for _ in range(n_occ):
-                    yield rupture
+            rups, n_occs = _sample_occurrences(source, shift_hypo)
         except Exception as err:
             etype, err, tb = sys.exc_info()
             msg = 'An error occurred with source id=%s. Error: %s'
             msg %= (source.source_id, str(err))
             raise_(etype, msg, tb)
+        for rupture, n_occ in zip(rups, n_occs):
+            yield from itertools.repeat(rupture, n_occ)
+
+
+def _sample_occurrences(source, shift_hypo):
+    # returns the ruptures of the source and their number of occurrences
+    rups = list(source.iter_ruptures(shift_hypo=shift_hypo))
+    if all(isinstance(rup, ParametricProbabilisticRupture) for rup in rups):
+        # a single poisson call, giving the same numbers as
+        # calling rup.sample_number_of_occurrences() in a loop
+        rates = numpy.array([
+            rup.occurrence_rate * rup.temporal_occurrence_model.time_span
+            for rup in rups])
+        n_occs = numpy.random.poisson(rates)
+    else:
+        n_occs = [rup.sample_number_of_occurrences()[0] for rup in rups]
+    return rups, n_occs
 
 
 # ######################## rupture calculator ############################ #
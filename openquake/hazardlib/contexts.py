@@ -32,12 +32,16 @@ from openquake.hazardlib import imt as imt_module
 from openquake.hazardlib.gsim import base
 from openquake.hazardlib.calc.filters import IntegrationDistance, getdefault
 from openquake.hazardlib.probability_map import ProbabilityMap
-from openquake.hazardlib.geo.surface import PlanarSurface
+from openquake.hazardlib.geo.surface import (
+    PlanarSurface, SimpleFaultSurface, ComplexFaultSurface)
+from openquake.hazardlib.geo.surface.gridded import GriddedSurface
 
 I16 = numpy.int16
 F32 = numpy.float32
 KNOWN_DISTANCES = frozenset(
     'rrup rx ry0 rjb rhypo repi rcdpp azimuth azimuth_cp rvolc'.split())
+# surfaces for which the rrup distance is computed from the full mesh
+MESH_SURFACES = (SimpleFaultSurface, ComplexFaultSurface, GriddedSurface)
 
 
 def get_distances(rupture, sites, param):
@@ -190,8 +194,21 @@ class ContextMaker(object):
         :returns:
             (filtered sites, distance context)
         """
-        distances = get_distances(rup, sites, self.filter_distance)
         mdist = self.maximum_distance(rup.tectonic_region_type, rup.mag)
+        if isinstance(rup.surface, MESH_SURFACES):
+            # the distances from a mesh are expensive, so the sites are
+            # prefiltered with the sphere enclosing the mesh: the sites
+            # farther than mdist + radius from the center are far away
+            xyz = rup.surface.mesh.xyz
+            center = xyz.mean(axis=0)
+            radius = numpy.sqrt(((xyz - center) ** 2).sum(axis=1)).max()
+            close = numpy.sqrt(
+                ((sites.xyz - center) ** 2).sum(axis=1)) <= mdist + radius
+            if not close.any():
+                raise FarAwayRupture(
+                    '%d: more than %d km' % (rup.rup_id, mdist))
+            sites = sites.filter(close)
+        distances = get_distances(rup, sites, self.filter_distance)
         mask = distances <= mdist
         if mask.any():
             sites, distances = sites.filter(mask), distances[mask]
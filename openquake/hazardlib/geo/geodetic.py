@@ -23,6 +23,10 @@ transformations, optimized for massive calculations.
 import numpy
 from scipy.spatial.distance import cdist
 from openquake.baselib.python3compat import round
+try:
+    import numba
+except ImportError:
+    numba = None
 
 #: Earth radius in km.
 EARTH_RADIUS = 6371.0
@@ -233,7 +237,42 @@ def min_geodetic_distance(a, b):
         a = spherical_to_cartesian(a[0].flatten(), a[1].flatten())
     if isinstance(b, tuple):
         b = spherical_to_cartesian(b[0].flatten(), b[1].flatten())
-    return cdist(a, b).min(axis=0)
+    return min_distance(a, b)
+
+
+def _min_distance(xyz1, xyz2):
+    # loop version of cdist(xyz1, xyz2).min(axis=0), compiled with numba
+    # to avoid allocating the full (N1, N2) matrix of distances
+    out = numpy.empty(len(xyz2))
+    for j in range(len(xyz2)):
+        mindist2 = numpy.inf
+        for i in range(len(xyz1)):
+            dist2 = ((xyz1[i, 0] - xyz2[j, 0]) ** 2 +
+                     (xyz1[i, 1] - xyz2[j, 1]) ** 2 +
+                     (xyz1[i, 2] - xyz2[j, 2]) ** 2)
+            if dist2 < mindist2:
+                mindist2 = dist2
+        out[j] = numpy.sqrt(mindist2)
+    return out
+
+
+if numba:
+    _min_distance = numba.njit(cache=True)(_min_distance)
+
+
+def min_distance(xyz1, xyz2):
+    """
+    Compute the minimum distance between the first set of points and each
+    point of the second set, in cartesian coordinates. If numba is installed
+    a compiled kernel is used, otherwise scipy.spatial.distance.cdist.
+
+    :param xyz1: an array of shape (N1, 3)
+    :param xyz2: an array of shape (N2, 3)
+    :returns: an array of N2 distances
+    """
+    if numba is None:
+        return cdist(xyz1, xyz2).min(axis=0)
+    return _min_distance(xyz1, xyz2)
 
 
 def distance_matrix(lons, lats, diameter=2*EARTH_RADIUS):
@@ -245,7 +245,7 @@ class Mesh(object):
         this mesh to each point of the target mesh and returns the lowest found
         for each.
         """
-        return cdist(self.xyz, mesh.xyz).min(axis=0)
+        return geodetic.min_distance(self.xyz, mesh.xyz)
 
     def get_closest_points(self, mesh):
         """
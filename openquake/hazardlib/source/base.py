@@ -23,6 +23,8 @@ from openquake.baselib.slots import with_slots
 from openquake.hazardlib.geo import Point
 from openquake.hazardlib.source.rupture import ParametricProbabilisticRupture
 
+U32 = numpy.uint32
+
 
 @with_slots
 class BaseSeismicSource(metaclass=abc.ABCMeta):
@@ -110,7 +112,8 @@ class BaseSeismicSource(metaclass=abc.ABCMeta):
         :yields: pairs (rupture, num_occurrences[num_samples])
         """
         tom = getattr(self, 'temporal_occurrence_model', None)
-        rupids = numpy.arange(self.serial, self.serial + self.num_ruptures)
+        rupids = numpy.arange(
+            self.serial, self.serial + self.num_ruptures, dtype=U32)
         if tom:  # time-independent source
             yield from self.sample_ruptures_poissonian(rupids, eff_num_ses)
         else:  # time-dependent source
@@ -151,39 +154,54 @@ class BaseSeismicSource(metaclass=abc.ABCMeta):
             rates = numpy.array([rup.occurrence_rate for rup in ruptures])
             numpy.random.seed(self.serial)
             occurs = numpy.random.poisson(rates * tom.time_span * eff_num_ses)
-            for rup, rup_id, num_occ in zip(ruptures, rupids, occurs):
-                if num_occ:
-                    rup.rup_id = rup_id  # used as seed
-                    yield rup, num_occ
+            for idx in occurs.nonzero()[0]:
+                rup = ruptures[idx]
+                rup.rup_id = rupids[idx]  # used as seed
+                yield rup, occurs[idx]
             return
         # else (multi)point sources and area sources
-        rup_args = []
+        # the rates of each point source are computed as an outer product
+        # mag x nodal plane x hypocenter and stored in a flat array, in the
+        # same order of the ruptures; all occurrences are sampled in a single
+        # poisson call and only the nonzero ones are converted into ruptures
+        rup_args = []  # (src, mags, nps, hcs) for each point source
         rates = []
         for src in self:
-            for mag, mag_occ_rate in src.get_annual_occurrence_rates():
-                if mag < self.min_mag:
-                    continue
-                for np_prob, np in src.nodal_plane_distribution.data:
-                    for hc_prob, hc_depth in src.hypocenter_distribution.data:
-                        args = (mag_occ_rate, np_prob, hc_prob,
-                                mag, np, hc_depth, src)
-                        rup_args.append(args)
-                        rates.append(mag_occ_rate * np_prob * hc_prob)
-        eff_rates = numpy.array(rates) * tom.time_span * eff_num_ses
+            mag_rates = [(mag, rate)
+                         for mag, rate in src.get_annual_occurrence_rates()
+                         if mag >= self.min_mag]
+            if not mag_rates:
+                continue
+            mags, mag_occ_rates = zip(*mag_rates)
+            np_probs, nps = zip(*src.nodal_plane_distribution.data)
+            hc_probs, hc_depths = zip(*src.hypocenter_distribution.data)
+            rates.append(numpy.multiply.outer(
+                numpy.multiply.outer(mag_occ_rates, np_probs),
+                hc_probs).flatten())
+            rup_args.append((src, mags, nps, hc_depths))
+        if not rates:
+            return
+        rates = numpy.concatenate(rates)
         numpy.random.seed(self.serial)
-        occurs = numpy.random.poisson(eff_rates)
-        for num_occ, args, rate, ser in zip(occurs, rup_args, rates, rupids):
-            if num_occ:
-                mag_occ_rate, np_prob, hc_prob, mag, np, hc_depth, src = args
+        occurs = numpy.random.poisson(rates * tom.time_span * eff_num_ses)
+        start = 0
+        for src, mags, nps, hc_depths in rup_args:
+            shp = len(mags), len(nps), len(hc_depths)
+            stop = start + shp[0] * shp[1] * shp[2]
+            idxs = start + occurs[start:stop].nonzero()[0]
+            for idx, m, n, h in zip(
+                    idxs, *numpy.unravel_index(idxs - start, shp)):
+                mag, np = mags[m], nps[n]
                 hc = Point(latitude=src.location.latitude,
                            longitude=src.location.longitude,
-                           depth=hc_depth)
+                           depth=hc_depths[h])
                 surface, _ = src._get_rupture_surface(mag, np, hc)
                 rup = ParametricProbabilisticRupture(
                     mag, np.rake, src.tectonic_region_type, hc,
-                    surface, rate, tom)
-                rup.rup_id = ser  # used as seed
-                yield rup, num_occ
+                    surface, rates[idx], tom)
+                rup.rup_id = rupids[idx]  # used as seed
+                yield rup, occurs[idx]
+            start = stop
 
     @abc.abstractmethod
     def get_one_rupture(self, rupture_mutex=False):
@@ -24,7 +24,6 @@ import abc
 import numpy
 import math
 import itertools
-import collections
 import toml
 from openquake.baselib import general
 from openquake.baselib.slots import with_slots
@@ -611,15 +610,17 @@ def get_eids(rup_array, samples_by_grp, num_rlzs_by_grp):
     :param samples_by_grp: a dictionary grp_id -> samples
     :param num_rlzs_by_grp: a dictionary grp_id -> num_rlzs
     """
-    all_eids = []
-    for rup in rup_array:
-        grp_id = rup['grp_id']
+    # number of events per rupture, computed with a lookup on the grp_id
+    grp_ids = numpy.unique(rup_array['grp_id'])
+    factor = numpy.zeros(grp_ids.max() + 1 if len(grp_ids) else 0, U32)
+    for grp_id in grp_ids:
         samples = samples_by_grp[grp_id]
-        num_rlzs = num_rlzs_by_grp[grp_id]
-        num_events = rup['n_occ'] if samples > 1 else rup['n_occ'] * num_rlzs
-        eids = numpy.arange(num_events, dtype=U32)
-        all_eids.append(eids)
-    return numpy.concatenate(all_eids)
+        factor[grp_id] = 1 if samples > 1 else num_rlzs_by_grp[grp_id]
+    num_events = rup_array['n_occ'] * factor[rup_array['grp_id']]
+    # a single arange minus the offset of each rupture
+    starts = num_events.cumsum() - num_events
+    return (numpy.arange(num_events.sum(), dtype=U32) -
+            numpy.repeat(starts, num_events).astype(U32))
 
 
 class EBRupture(object):
@@ -674,13 +675,15 @@ class EBRupture(object):
         """
         :returns: an array of events with fields eid, rlz
         """
-        all_eids, rlzs = [], []
-        for rlz, eids in self.get_eids_by_rlz(rlzs_by_gsim).items():
-            all_eids.extend(eids)
-            rlzs.extend([rlz] * len(eids))
-        evs = U32(all_eids) + (e0 if e0 is not None else self.e0)
-        rupids = [self.rup_id] * len(evs)
-        return numpy.fromiter(zip(evs, rupids, rlzs), events_dt)
+        eids_by_rlz = self.get_eids_by_rlz(rlzs_by_gsim)
+        nevents = [len(eids) for eids in eids_by_rlz.values()]
+        events = numpy.zeros(sum(nevents), events_dt)
+        if eids_by_rlz:
+            evs = numpy.concatenate(list(eids_by_rlz.values()))
+            events['id'] = evs + (e0 if e0 is not None else self.e0)
+            events['rup_id'] = self.rup_id
+            events['rlz_id'] = numpy.repeat(list(eids_by_rlz), nevents)
+        return events
 
     def get_eids(self, num_rlzs):
         """
@@ -696,12 +699,11 @@ class EBRupture(object):
         """
         numpy.random.seed(self.rup_id)
         sess = numpy.random.choice(num_ses, len(events)) + 1
-        events_by_ses = collections.defaultdict(list)
-        for ses, event in zip(sess, events):
-            events_by_ses[ses].append(event)
-        for ses in events_by_ses:
-            events_by_ses[ses] = numpy.array(events_by_ses[ses])
-        return events_by_ses
+        order = sess.argsort(kind='stable')  # keep the order of the events
+        uniq, starts = numpy.unique(sess[order], return_index=True)
+        evs = numpy.split(events[order], starts[1:])
+        # the SES indices are returned in order of first appearance
+        return {uniq[i]: evs[i] for i in order[starts].argsort()}
 
     def get_ses_by_eid(self, rlzs_by_gsim, num_ses):
         events = self.get_events(rlzs_by_gsim)
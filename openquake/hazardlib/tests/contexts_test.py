@@ -18,7 +18,12 @@
 
 import unittest
 import numpy
-from openquake.hazardlib.contexts import Effect
+from openquake.hazardlib.contexts import (
+    Effect, ContextMaker, FarAwayRupture, get_distances)
+from openquake.hazardlib.calc.filters import IntegrationDistance
+from openquake.hazardlib.geo import Point, Line, SimpleFaultSurface
+from openquake.hazardlib.site import Site, SiteCollection
+from openquake.hazardlib.source.rupture import BaseRupture
 
 dists = numpy.array([0, 10, 20, 30, 40, 50])
 intensities = {
@@ -39,3 +44,36 @@ class EffectTestCase(unittest.TestCase):
 
         dist = list(effect.dist_by_mag(1.1).values())
         numpy.testing.assert_allclose(dist, [0, 10, 13.225806, 16.666667])
+
+
+class FilterTestCase(unittest.TestCase):
+    # test the bounding sphere prefiltering for ruptures with a mesh
+    def setUp(self):
+        surface = SimpleFaultSurface.from_fault_data(
+            Line([Point(0, 0), Point(0, .5)]), upper_seismogenic_depth=2,
+            lower_seismogenic_depth=15, dip=90, mesh_spacing=1)
+        self.rup = BaseRupture(6., 0, 'Active Shallow Crust',
+                               Point(0, .25, 8), surface)
+        self.cmaker = ContextMaker('Active Shallow Crust', [], dict(
+            maximum_distance=IntegrationDistance({'default': 50})))
+
+    def sitecol(self, lons):
+        return SiteCollection([Site(Point(lon, .25), vs30=760, z1pt0=40,
+                                    z2pt5=1) for lon in lons])
+
+    def test_far_away(self):
+        # all the sites are outside the sphere of radius mdist + radius
+        with self.assertRaises(FarAwayRupture) as ctx:
+            self.cmaker.filter(self.sitecol([3., 4., -5.]), self.rup)
+        self.assertIn('more than 50 km', str(ctx.exception))
+
+    def test_mixed(self):
+        # sites within mdist, within mdist + radius and outside the sphere
+        sites = self.sitecol(
+            [0., .1, -.3, .4, .6, -.7, .9, 3., 4., -5.])
+        rrup = get_distances(self.rup, sites, 'rrup')
+        ok = rrup <= 50
+        self.assertTrue(0 < ok.sum() < len(sites))
+        close, dctx = self.cmaker.filter(sites, self.rup)
+        numpy.testing.assert_equal(close.sids, sites.sids[ok])
+        numpy.testing.assert_equal(dctx.rrup, rrup[ok])
@@ -17,6 +17,7 @@ import unittest
 import collections
 
 import numpy
+from scipy.spatial.distance import cdist
 
 from openquake.hazardlib.geo import geodetic
 
@@ -485,3 +486,31 @@ class IntervalsBetweenTest(unittest.TestCase):
         assert_aeq(34, lats_2.shape[0])
         assert_aeq(34, depths_1.shape[0])
         assert_aeq(34, depths_2.shape[0])
+
+
+class MinDistanceTest(unittest.TestCase):
+    # the kernel must give the same results as cdist, both in its plain
+    # Python version and in the one used by min_distance (jitted if numba
+    # is installed)
+    def check(self, n1, n2):
+        rng = numpy.random.RandomState(42)
+        xyz1 = geodetic.spherical_to_cartesian(
+            rng.uniform(-1, 1, n1), rng.uniform(-1, 1, n1),
+            rng.uniform(0, 20, n1))
+        xyz2 = geodetic.spherical_to_cartesian(
+            rng.uniform(-1, 1, n2), rng.uniform(-1, 1, n2))
+        expected = cdist(xyz1, xyz2).min(axis=0)
+        py_func = getattr(geodetic._min_distance, 'py_func',
+                          geodetic._min_distance)
+        numpy.testing.assert_array_equal(py_func(xyz1, xyz2), expected)
+        numpy.testing.assert_array_equal(
+            geodetic.min_distance(xyz1, xyz2), expected)
+
+    def test_different_sizes(self):
+        self.check(50, 7)
+        self.check(7, 50)
+
+    def test_single_point(self):
+        self.check(1, 10)
+        self.check(10, 1)
+        self.check(1, 1)